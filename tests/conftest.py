@@ -0,0 +1,96 @@
+"""共用 pytest fixtures
+
+YAML 解析是測試中最昂貴的步驟，這裡以 session scope 搭配
+functools.lru_cache 快取解析結果，讓每個 pytest 執行
+對每個 YAML 檔案只解析一次，供所有測試類別共用。
+"""
+
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+import yaml
+
+try:
+    # libyaml 的 C 解析器，比純 Python 解析快 5-10 倍
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - 無 libyaml 時退回純 Python
+    from yaml import SafeLoader
+
+# 專案路徑
+PROJECT_ROOT = Path(__file__).parent.parent
+TERMS_DIR = PROJECT_ROOT / "terms"
+META_DIR = PROJECT_ROOT / "meta"
+
+
+def _load_yaml(path):
+    """解析單一 YAML 檔案，以 mmap 直接餵 bytes 給 libyaml，省去文字解碼"""
+    with open(path, "rb") as f:
+        # 空檔案無法 mmap；維持 safe_load 對空檔案回傳 None 的行為
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return yaml.load(mm, Loader=SafeLoader)
+
+
+@lru_cache(maxsize=None)
+def load_all_yaml_files():
+    """載入所有術語 YAML 檔案"""
+    # os.scandir 的 DirEntry 快取 stat 結果，比 Path.glob 少一次 stat 系統呼叫
+    yaml_entries = sorted(
+        (entry.name, entry.path)
+        for entry in os.scandir(TERMS_DIR)
+        if entry.is_file() and entry.name.endswith(".yaml")
+    )
+    # 以執行緒重疊檔案 I/O 與解析；map 保持排序後的順序
+    names = [name for name, _ in yaml_entries]
+    paths = [path for _, path in yaml_entries]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return dict(zip(names, executor.map(_load_yaml, paths)))
+
+
+@lru_cache(maxsize=None)
+def get_all_terms():
+    """取得所有術語"""
+    all_data = load_all_yaml_files()
+    terms = []
+    for filename, data in all_data.items():
+        if data and "terms" in data:
+            for term in data["terms"]:
+                term["_source_file"] = filename
+                terms.append(term)
+    return terms
+
+
+@lru_cache(maxsize=None)
+def load_valid_categories():
+    """載入有效的分類列表"""
+    categories_file = META_DIR / "categories.yaml"
+    if categories_file.exists():
+        data = _load_yaml(categories_file)
+        return [cat["id"] for cat in data.get("categories", [])]
+    return []
+
+
+@pytest.fixture(scope="session")
+def all_yaml_files():
+    return load_all_yaml_files()
+
+
+@pytest.fixture(scope="session")
+def all_terms():
+    return get_all_terms()
+
+
+@pytest.fixture(scope="session")
+def valid_categories():
+    # frozenset 讓每個術語的分類檢查是 O(1)，而非對列表線性掃描
+    return frozenset(load_valid_categories())
+
+
+@pytest.fixture(scope="session")
+def all_term_ids(all_terms):
+    return frozenset(term.get("id") for term in all_terms if term.get("id"))
@@ -9,64 +9,38 @@
 """
 
 import re
-from pathlib import Path
 
 import pytest
-import yaml
 
-# 專案路徑
-PROJECT_ROOT = Path(__file__).parent.parent
-TERMS_DIR = PROJECT_ROOT / "terms"
-META_DIR = PROJECT_ROOT / "meta"
+from tests.conftest import TERMS_DIR, get_all_terms
 
 # 必填欄位
 REQUIRED_FIELDS = ["id", "term_en", "term_zh", "definitions", "category"]
+_REQUIRED_FIELDS_SET = frozenset(REQUIRED_FIELDS)
 REQUIRED_DEFINITION_FIELDS = ["brief"]
 
-# URL 正規表達式
-URL_PATTERN = re.compile(r"https?://[^\s\"'<>]+")
+# 術語 ID 格式（snake_case），模組層級編譯一次
+_ID_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
 
+# URL 格式檢查：常數前綴比對加禁用字元集合，皆為 C 層字串運算，
+# 比對每個 URL 都走 regex 引擎快得多
+_BAD_URL_CHARS = frozenset(" \t\r\n\"'<>")
 
-def load_all_yaml_files():
-    """載入所有術語 YAML 檔案"""
-    yaml_files = list(TERMS_DIR.glob("*.yaml"))
-    all_data = {}
-    for yaml_file in yaml_files:
-        with open(yaml_file, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-            all_data[yaml_file.name] = data
-    return all_data
 
-
-def get_all_terms():
-    """取得所有術語"""
-    all_data = load_all_yaml_files()
-    terms = []
-    for filename, data in all_data.items():
-        if data and "terms" in data:
-            for term in data["terms"]:
-                term["_source_file"] = filename
-                terms.append(term)
-    return terms
-
-
-def load_valid_categories():
-    """載入有效的分類列表"""
-    categories_file = META_DIR / "categories.yaml"
-    if categories_file.exists():
-        with open(categories_file, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-            return [cat["id"] for cat in data.get("categories", [])]
-    return []
+def _is_valid_url(url: str) -> bool:
+    """檢查 URL 具備 http(s) scheme、非空且不含空白或引號"""
+    if url.startswith("https://"):
+        rest = url[8:]
+    elif url.startswith("http://"):
+        rest = url[7:]
+    else:
+        return False
+    return bool(rest) and _BAD_URL_CHARS.isdisjoint(rest)
 
 
 class TestYamlStructure:
     """YAML 結構驗證"""
 
-    @pytest.fixture(scope="class")
-    def all_yaml_files(self):
-        return load_all_yaml_files()
-
     def test_yaml_files_exist(self):
         """測試術語檔案存在"""
         yaml_files = list(TERMS_DIR.glob("*.yaml"))
@@ -88,10 +62,6 @@ class TestYamlStructure:
 class TestTermIdUniqueness:
     """術語 ID 唯一性驗證"""
 
-    @pytest.fixture(scope="class")
-    def all_terms(self):
-        return get_all_terms()
-
     def test_term_ids_unique_globally(self, all_terms):
         """測試全域術語 ID 唯一"""
         seen_ids = {}
@@ -112,15 +82,13 @@ class TestTermIdUniqueness:
 
     def test_term_id_format(self, all_terms):
         """測試術語 ID 格式（snake_case）"""
-        invalid_ids = []
-        id_pattern = re.compile(r"^[a-z][a-z0-9_]*$")
-
-        for term in all_terms:
-            term_id = term.get("id", "")
-            if not id_pattern.match(term_id):
-                invalid_ids.append(
-                    f"無效 ID '{term_id}' (來自 {term.get('_source_file')})"
-                )
+        # 綁定一次 match，常見的全數通過情況只剩 C 層呼叫
+        match = _ID_PATTERN.match
+        invalid_terms = [term for term in all_terms if not match(term.get("id", ""))]
+        invalid_ids = [
+            f"無效 ID '{term.get('id', '')}' (來自 {term.get('_source_file')})"
+            for term in invalid_terms
+        ]
 
         assert len(invalid_ids) == 0, (
             f"術語 ID 應該使用 snake_case 格式:\n" + "\n".join(invalid_ids)
@@ -130,15 +98,17 @@ class TestTermIdUniqueness:
 class TestRequiredFields:
     """必填欄位驗證"""
 
-    @pytest.fixture(scope="class")
-    def all_terms(self):
-        return get_all_terms()
-
     def test_required_fields_present(self, all_terms):
         """測試必填欄位存在"""
         missing_fields = []
 
         for term in all_terms:
+            # 快速路徑：欄位齊備且皆非 None（集合比較在 C 層完成）
+            if _REQUIRED_FIELDS_SET <= term.keys() and all(
+                term[field] is not None for field in REQUIRED_FIELDS
+            ):
+                continue
+
             term_id = term.get("id", "unknown")
             source = term.get("_source_file", "unknown")
 
@@ -189,14 +159,6 @@ class TestRequiredFields:
 class TestCategoryConsistency:
     """分類一致性驗證"""
 
-    @pytest.fixture(scope="class")
-    def all_terms(self):
-        return get_all_terms()
-
-    @pytest.fixture(scope="class")
-    def valid_categories(self):
-        return load_valid_categories()
-
     def test_category_is_valid(self, all_terms, valid_categories):
         """測試分類是有效的"""
         if not valid_categories:
@@ -241,44 +203,38 @@ class TestCategoryConsistency:
 class TestRelatedTerms:
     """相關術語驗證"""
 
-    @pytest.fixture(scope="class")
-    def all_terms(self):
-        return get_all_terms()
-
-    @pytest.fixture(scope="class")
-    def all_term_ids(self, all_terms):
-        return {term.get("id") for term in all_terms if term.get("id")}
-
     def test_related_terms_exist(self, all_terms, all_term_ids):
         """測試 related_terms 中的術語存在"""
-        missing_references = []
-
-        for term in all_terms:
-            term_id = term.get("id", "unknown")
-            source = term.get("_source_file", "unknown")
-            related = term.get("related_terms", [])
-
-            if not isinstance(related, list):
-                continue
-
-            for ref_id in related:
-                if ref_id not in all_term_ids:
-                    missing_references.append(
-                        f"{source}/{term_id}: related_terms 引用不存在的 '{ref_id}'"
-                    )
+        # 一次聯集所有引用再做集合差，兩個 C 層集合運算取代逐對比對
+        requested: set = set().union(
+            *(
+                term["related_terms"]
+                for term in all_terms
+                if isinstance(term.get("related_terms"), list)
+            )
+        )
+        missing = requested - all_term_ids
+        if not missing:
+            return
+
+        # 只有在真的缺引用時才回頭找出是誰引用的
+        missing_references = [
+            f"{term.get('_source_file', 'unknown')}/{term.get('id', 'unknown')}: "
+            f"related_terms 引用不存在的 '{ref_id}'"
+            for term in all_terms
+            if isinstance(term.get("related_terms"), list)
+            for ref_id in term["related_terms"]
+            if ref_id in missing
+        ]
 
         # 只警告，不強制失敗（可能是未來要新增的術語）
-        if missing_references and len(missing_references) > 10:
+        if len(missing_references) > 10:
             print(f"\n警告: 發現 {len(missing_references)} 個不存在的相關術語引用")
 
 
 class TestUrlValidity:
     """URL 有效性驗證（格式檢查）"""
 
-    @pytest.fixture(scope="class")
-    def all_terms(self):
-        return get_all_terms()
-
     def test_reference_urls_format(self, all_terms):
         """測試 references 中的 URL 格式正確"""
         invalid_urls = []
@@ -293,7 +249,7 @@ class TestUrlValidity:
 
             for key, url in references.items():
                 if url and isinstance(url, str):
-                    if not URL_PATTERN.match(url):
+                    if not _is_valid_url(url):
                         invalid_urls.append(
                             f"{source}/{term_id}: references.{key} 不是有效 URL"
                         )